@@ -1,12 +1,17 @@
 """Adds support for Landroid Cloud compatible devices."""
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 import logging
 
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_TYPE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_send,
+    dispatcher_send,
+)
 from homeassistant.loader import async_get_integration
 from homeassistant.util import slugify as util_slugify
 
@@ -61,8 +66,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_forward_entry_unload(entry, PLATFORM)
 
     if unload_ok:
-        for unsub in hass.data[DOMAIN][entry.entry_id]["api"].listeners:
-            unsub()
+        for slot in hass.data[DOMAIN][entry.entry_id]["devices"]:
+            for unsub in slot.api.listeners:
+                unsub()
         hass.data[DOMAIN].pop(entry.entry_id)
 
         return True
@@ -87,8 +93,9 @@ async def _setup(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if cloud_type is None:
         cloud_type = "worx"
+    cloud_type = cloud_type.lower()
 
-    master = WorxCloud(cloud_email, cloud_password, cloud_type.lower())
+    master = WorxCloud(cloud_email, cloud_password, cloud_type)
     auth = await hass.async_add_executor_job(master.initialize)
 
     if not auth:
@@ -101,29 +108,37 @@ async def _setup(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.warning(err)
         return False
 
-    hass.data[DOMAIN][entry.entry_id] = {}
-    hass.data[DOMAIN][entry.entry_id]["clients"] = []
-
-    for device in range(num_dev):
-        hass.data[DOMAIN][entry.entry_id]["clients"].append(device)
+    async def _setup_device(device: int) -> WorxCloud:
+        """Initialize and connect a single device."""
         _LOGGER.debug("Setting up device %s (%s)", device, cloud_email)
-        hass.data[DOMAIN][entry.entry_id]["clients"][device] = WorxCloud(
-            cloud_email, cloud_password, cloud_type.lower()
-        )
-        await hass.async_add_executor_job(
-            hass.data[DOMAIN][entry.entry_id]["clients"][device].initialize
-        )
-        await hass.async_add_executor_job(
-            hass.data[DOMAIN][entry.entry_id]["clients"][device].connect, device, False
-        )
-        api = LandroidAPI(
-            hass, device, hass.data[DOMAIN][entry.entry_id]["clients"][device], entry
-        )
-        hass.data[DOMAIN][entry.entry_id]["api"] = api
+        client = WorxCloud(cloud_email, cloud_password, cloud_type)
+        await hass.async_add_executor_job(_init_and_connect, client, device)
+        return client
+
+    clients = await asyncio.gather(*[_setup_device(i) for i in range(num_dev)])
+
+    config = {
+        CONF_EMAIL: cloud_email,
+        CONF_TYPE: cloud_type,
+    }
+
+    hass.data[DOMAIN][entry.entry_id] = {
+        "meta": {**config, "count": num_dev},
+        "devices": [
+            DeviceSlot(client, LandroidAPI(hass, device, client, entry, config))
+            for device, client in enumerate(clients)
+        ],
+    }
 
     return True
 
 
+def _init_and_connect(device: WorxCloud, index: int) -> None:
+    """Initialize and connect a device in a single executor job."""
+    device.initialize()
+    device.connect(index, False)
+
+
 async def check_unique_id(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Check if a device unique ID is set."""
     if not isinstance(entry.unique_id, type(None)):
@@ -144,23 +159,54 @@ async def check_unique_id(hass: HomeAssistant, entry: ConfigEntry) -> None:
     _LOGGER.debug("Update successful? %s", result)
 
 
+@dataclass
+class DeviceSlot:
+    """Device and API handler for a single device."""
+
+    __slots__ = ("device", "api")
+
+    device: WorxCloud
+    api: LandroidAPI
+
+
 class LandroidAPI:
     """Handle the API calls."""
 
+    __slots__ = (
+        "_hass",
+        "entry_id",
+        "data",
+        "options",
+        "config",
+        "device",
+        "index",
+        "listeners",
+        "name",
+        "friendly_name",
+        "update_signal",
+    )
+
     def __init__(
-        self, hass: HomeAssistant, index: int, device: WorxCloud, entry: ConfigEntry
+        self,
+        hass: HomeAssistant,
+        index: int,
+        device: WorxCloud,
+        entry: ConfigEntry,
+        config: dict,
     ):
         """Set up device."""
         self._hass = hass
         self.entry_id = entry.entry_id
         self.data = entry.data
         self.options = entry.options
+        self.config = config
         self.device = device
         self.index = index
         self.listeners = []
 
         self.name = util_slugify(f"{self.device.name}")
         self.friendly_name = self.device.name
+        self.update_signal = f"{UPDATE_SIGNAL}_{self.device.name}"
 
         self.device.set_callback(self.receive_data)
 
@@ -168,16 +214,16 @@ class LandroidAPI:
         """Used as callback from API when data is received."""
         _LOGGER.debug(
             "Update signal received from API on %s for device %s",
-            self.data.get(CONF_EMAIL),
+            self.config[CONF_EMAIL],
             self.device.name,
         )
-        dispatcher_send(self._hass, f"{UPDATE_SIGNAL}_{self.device.name}")
+        dispatcher_send(self._hass, self.update_signal)
 
     async def async_refresh(self):
         """Try fetching data from cloud."""
         await self._hass.async_add_executor_job(self.device.update)
-        dispatcher_send(self._hass, f"{UPDATE_SIGNAL}_{self.device.name}")
+        async_dispatcher_send(self._hass, self.update_signal)
 
     async def async_update(self):
         """Update the state cache from cloud API."""
-        dispatcher_send(self._hass, f"{UPDATE_SIGNAL}_{self.device.name}")
+        async_dispatcher_send(self._hass, self.update_signal)
@@ -1,13 +1,14 @@
 """Define device classes."""
 from __future__ import annotations
 from functools import partial
-import json
 
 import logging
 from typing import Any
 
 #from abc import ABC, abstractmethod
 
+import orjson
+
 from homeassistant.components.vacuum import (
     ENTITY_ID_FORMAT,
     STATE_DOCKED,
@@ -25,7 +26,7 @@ import homeassistant.helpers.device_registry as dr
 from pyworxcloud import WorxCloud
 from pyworxcloud.states import ERROR_TO_DESCRIPTION
 
-from .utils import pass_thru, parseday
+from .utils import pass_day, pass_thru, parseday
 
 from .attribute_map import ATTR_MAP
 
@@ -38,7 +39,6 @@ from .const import (
     STATE_MOWING,
     STATE_OFFLINE,
     STATE_RAINDELAY,
-    UPDATE_SIGNAL,
 )
 
 # Commonly supported features
@@ -53,6 +53,16 @@ SUPPORT_LANDROID_BASE = (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static attribute mapping, resolved once instead of on every update
+_DEFAULT_STATE_PAIRS = tuple(ATTR_MAP["default"]["state"].items())
+_DEFAULT_ICON = ATTR_MAP["default"]["icon"]
+
+# Error codes with a dedicated state, any other error maps to STATE_ERROR
+_ERROR_STATE = {5: STATE_RAINDELAY}
+
+# States where the mower is already at or heading to the dock
+_DOCK_STATES = frozenset({STATE_DOCKED, STATE_RETURNING})
+
 
 class LandroidCloudBase(StateVacuumEntity):
     """Define a base Landroid class."""
@@ -66,33 +76,31 @@ class LandroidCloudBase(StateVacuumEntity):
         self.api = api
         self.hass = hass
 
-        self.entity_id = ENTITY_ID_FORMAT.format(f"{api.name}")
+        self.entity_id = ENTITY_ID_FORMAT.format(api.name)
 
         self._attributes = {}
         self._available = False
-        self._name = f"{api.friendly_name}"
+        self._name = api.friendly_name
         self._unique_id = f"{api.device.serial_number}_{api.name}"
         self._serialnumber = None
-        self._mac = None
-        self._connections = {}
+        self._mac = api.device.mac
+        self._connections = {(dr.CONNECTION_NETWORK_MAC, self._mac)}
         self._icon = None
 
+        self._attr_device_info = {
+            "connections": self._connections,
+            "identifiers": {(DOMAIN, api.entry_id, api.friendly_name)},
+            "name": self._name,
+            "sw_version": api.device.firmware_version,
+            "manufacturer": api.data.get(CONF_TYPE),
+            "model": api.device.board,
+        }
+
     @property
     def extra_state_attributes(self):
         """Return sensor attributes."""
         return self._attributes
 
-    @property
-    def device_info(self):
-        return {
-            "connections": self._connections,
-            "identifiers": {(DOMAIN, self.api.entry_id, self.api.friendly_name)},
-            "name": str(self.name),
-            "sw_version": self.api.device.firmware_version,
-            "manufacturer": self.api.data.get(CONF_TYPE),
-            "model": self.api.device.board,
-        }
-
     @property
     def device_class(self) -> str:
         """Return the ID of the capability, to identify the entity for translations."""
@@ -141,9 +149,19 @@ class LandroidCloudBase(StateVacuumEntity):
     def update_callback(self):
         """Get new data and update state."""
         _LOGGER.debug("Updating state in Home Assistant")
-        self.zone_mapping()
-        self.schedule_update_ha_state(True)
-        # self.async_schedule_update_ha_state(True)
+        self.hass.async_create_task(self.async_update_and_write())
+
+    async def async_update_and_write(self):
+        """Update the sensor and write its state."""
+        try:
+            self.zone_mapping()
+            await self.async_update()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Update for %s fails", self.entity_id)
+            return
+
+        # Home Assistant core drops writes with unchanged state and attributes
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self):
         """Connect update callbacks."""
@@ -152,7 +170,7 @@ class LandroidCloudBase(StateVacuumEntity):
         await self.api.async_refresh()
         async_dispatcher_connect(
             self.hass,
-            f"{UPDATE_SIGNAL}_{self.api.device.name}",
+            self.api.update_signal,
             self.update_callback,
         )
 
@@ -161,42 +179,42 @@ class LandroidCloudBase(StateVacuumEntity):
         _LOGGER.debug("Updating %s", self.entity_id)
         master: WorxCloud = self.api.device
 
-        methods = ATTR_MAP["default"]
-        data = {}
-        self._icon = methods["icon"]
-        for prop, attr in methods["state"].items():
-            if hasattr(master, prop):
-                prop_data = getattr(master, prop)
-                if not isinstance(prop_data, type(None)):
-                    data[attr] = prop_data
-        data["error"] = ERROR_TO_DESCRIPTION[master.error or 0]
-        _LOGGER.debug(data)
+        online = master.online
+        _LOGGER.debug("Mower %s online: %s", self._name, online)
+        self._available = online
+        if not online:
+            # Entity is reported unavailable, no need to refresh attributes
+            self._attributes["online"] = False
+            self._attr_state = STATE_OFFLINE
+            return
 
-        try:
-            state = STATE_MAP[master.status]
-        except KeyError:
-            state = STATE_INITIALIZING
+        data = {}
+        self._icon = _DEFAULT_ICON
+        for prop, attr in _DEFAULT_STATE_PAIRS:
+            prop_data = getattr(master, prop, None)
+            if prop_data is not None:
+                data[attr] = prop_data
+        error = master.error or 0
+        data["error"] = ERROR_TO_DESCRIPTION[error]
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(data)
 
         self._attributes.update(data)
 
-        _LOGGER.debug("Mower %s online: %s", self._name, master.online)
-        self._available = master.online
-        if not master.online:
-            state = STATE_OFFLINE
-
-        if master.error is not None:
-            if master.error > 0 and master.error != 5:
-                state = STATE_ERROR
-            elif master.error == 5:
-                state = STATE_RAINDELAY
+        if error > 0:
+            state = _ERROR_STATE.get(error, STATE_ERROR)
+        else:
+            state = STATE_MAP.get(master.status, STATE_INITIALIZING)
 
         _LOGGER.debug("Mower %s state '%s'", self._name, state)
         # self._state = state
         self._attr_state = state
 
-        self._mac = master.mac
+        if master.mac != self._mac:
+            self._mac = master.mac
+            self._connections = {(dr.CONNECTION_NETWORK_MAC, self._mac)}
+            self._attr_device_info["connections"] = self._connections
         self._serialnumber = master.serial
-        self._connections = {(dr.CONNECTION_NETWORK_MAC, self._mac)}
         self._battery_level = master.battery_percent
 
     async def async_start(self):
@@ -214,14 +232,14 @@ class LandroidCloudBase(StateVacuumEntity):
     async def async_start_pause(self):
         """Toggle the state of the mower."""
         _LOGGER.debug("Toggeling state of %s", self._name)
-        if STATE_MOWING in self.state:
+        if self.state == STATE_MOWING:
             await self.async_pause()
         else:
             await self.async_start()
 
     async def async_return_to_base(self, **kwargs: Any):
         """Set the vacuum cleaner to return to the dock."""
-        if self.state not in [STATE_DOCKED, STATE_RETURNING]:
+        if self.state not in _DOCK_STATES:
             device: WorxCloud = self.api.device
             _LOGGER.debug("Sending %s back to dock", self._name)
             await self.hass.async_add_executor_job(device.home)
@@ -250,31 +268,25 @@ class LandroidCloudBase(StateVacuumEntity):
                 device.schedules["primary"]
             )
 
-        schedule[SCHEDULE_TYPE_MAP[schedule_type]] = []
-        _LOGGER.debug(json.dumps(schedule))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(orjson.dumps(schedule).decode())
         _LOGGER.debug("Generating %s schedule", schedule_type)
-        for day in SCHEDULE_TO_DAY.items():
-            day = day[1]
+        for day in SCHEDULE_TO_DAY.values():
             if day["start"] in service_call.data:
-                # Found day in dataset, generating an update to the schedule
+                # Found day in dataset, make sure it is complete
                 if not day["end"] in service_call.data:
                     raise HomeAssistantError(
                         f"No end time specified for {day['clear']}"
                     )
-                schedule[SCHEDULE_TYPE_MAP[schedule_type]].append(
-                    parseday(day, service_call.data)
-                )
-            else:
-                # Didn't find day in dataset, parsing existing thru
-                current = []
-                current.append(device.schedules[schedule_type][day["clear"]]["start"])
-                current.append(
-                    device.schedules[schedule_type][day["clear"]]["duration"]
-                )
-                current.append(
-                    int(device.schedules[schedule_type][day["clear"]]["boundary"])
-                )
-                schedule[SCHEDULE_TYPE_MAP[schedule_type]].append(current)
+
+        current_schedule = device.schedules[schedule_type]
+        # Days found in the dataset are updated, the rest are parsed thru
+        schedule[SCHEDULE_TYPE_MAP[schedule_type]] = [
+            parseday(day, service_call.data)
+            if day["start"] in service_call.data
+            else pass_day(current_schedule[day["clear"]])
+            for day in SCHEDULE_TO_DAY.values()
+        ]
 
         if schedule_type == "primary":
             # We are generating a primary schedule
@@ -283,7 +295,7 @@ class LandroidCloudBase(StateVacuumEntity):
                 device.schedules["secondary"]
             )
 
-        data = json.dumps({"sc": schedule})
+        data = orjson.dumps({"sc": schedule}).decode()
         _LOGGER.debug(
             "New %s schedule, %s, sent to %s", schedule_type, data, self._name
         )
@@ -1,11 +1,11 @@
 """Worx Landroid device definition."""
 # pylint: disable=unused-argument,relative-beyond-top-level
 from __future__ import annotations
-import json
 
 import logging
 
 from functools import partial
+import orjson
 import voluptuous as vol
 
 from homeassistant.components.vacuum import StateVacuumEntity
@@ -54,6 +54,8 @@ OTS_SCHEME = {
 class WorxDevice(LandroidCloudBase, StateVacuumEntity):
     """Definition of Worx Landroid device."""
 
+    _last_zones: tuple | None = None
+
     # def __init__(self, hass, api):
     #     """Init new base device."""
     #     super().__init__(hass, api)
@@ -69,9 +71,13 @@ class WorxDevice(LandroidCloudBase, StateVacuumEntity):
         device: WorxCloud = self.api.device
         current_zone = device.mowing_zone
         virtual_zones = device.zone_probability
+        zones = (current_zone, tuple(virtual_zones or ()))
+        if zones == self._last_zones:
+            return
         _LOGGER.debug("Zone reported by API: %s", current_zone)
         _LOGGER.debug("Corrected zone: %s", virtual_zones[current_zone])
         self._attributes.update({"current_zone": virtual_zones[current_zone]})
+        self._last_zones = zones
 
     async def async_toggle_lock(self, service_call: ServiceCall = None):
         """Toggle locked state."""
@@ -181,7 +187,6 @@ class WorxDevice(LandroidCloudBase, StateVacuumEntity):
                 self._name,
                 data["multizone_probabilities"],
             )
-            tmpdata["mzv"] = []
             sections = [
                 int(x)
                 for x in data["multizone_probabilities"]
@@ -196,12 +201,13 @@ class WorxDevice(LandroidCloudBase, StateVacuumEntity):
             if sum(sections) != 100:
                 raise HomeAssistantError("Sum of zone probabilities array MUST be 100")
 
-            for idx, val in enumerate(sections):
-                share = int(int(val) / 10)
-                for _ in range(share):
-                    tmpdata["mzv"].append(idx)
+            tmpdata["mzv"] = [
+                idx
+                for idx, val in enumerate(sections)
+                for _ in range(int(int(val) / 10))
+            ]
 
         if tmpdata:
-            data = json.dumps(tmpdata)
+            data = orjson.dumps(tmpdata).decode()
             _LOGGER.debug("%s got new config: %s", self._name, data)
             await self.hass.async_add_executor_job(partial(device.send, data))
@@ -53,22 +53,14 @@ def parseday(day: dict, data: dict) -> list:
 
 def pass_thru(schedule, sunday_first: bool = True) -> list:
     """Parse primary schedule thru, before generating secondary schedule."""
-    result = []
-
+    days = list(schedule)
     if sunday_first:
-        result.append(
-            [
-                schedule["sunday"]["start"],
-                int(schedule["sunday"]["duration"]),
-                int(schedule["sunday"]["boundary"]),
-            ]
-        )
+        days.remove("sunday")
+        days.insert(0, "sunday")
 
-    for day in schedule.items():
-        _LOGGER.debug(day)
-        if sunday_first and day[0] != "sunday":
-            result.append(
-                [day[1]["start"], int(day[1]["duration"]), int(day[1]["boundary"])]
-            )
+    return [pass_day(schedule[day]) for day in days]
 
-    return result
+
+def pass_day(day: dict) -> list:
+    """Parse an existing schedule day thru."""
+    return [day["start"], int(day["duration"]), int(day["boundary"])]
@@ -39,11 +39,11 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the iRobot Roomba vacuum cleaner."""
-    api = hass.data[DOMAIN][config.entry_id]["api"]
+    entry_data = hass.data[DOMAIN][config.entry_id]
 
     platform = entity_platform.async_get_current_platform()
     constructor: type[LandroidCloudBase]
-    vendor = api.data.get(CONF_TYPE).lower()
+    vendor = entry_data["meta"][CONF_TYPE]
 
     if vendor == "worx":
         constructor = WorxDevice
@@ -99,6 +99,6 @@ async def async_setup_entry(
         constructor.async_set_schedule,
     )
 
-    landroid_mower = constructor(hass, api)
-
-    async_add_entities([landroid_mower], True)
+    async_add_entities(
+        [constructor(hass, slot.api) for slot in entry_data["devices"]], True
+    )